@@ -0,0 +1,105 @@
+# Render Benchmark
+# Times a busy game frame (rotating meteors, background, sprites, scale to window) at each render preset.
+# The background is the game's own, so the savings match a real frame; --parallax adds the layer as in main.py.
+# Run from the game folder like main.py: python code/benchmark.py [--sprites 200] [--meteors 30] [--parallax]
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import random
+import time
+from os.path import join
+import pygame
+from render import RENDER_PRESETS, Background, Renderer, rotated
+
+WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
+
+# Stand-in sprite - just an image and a rect, like the game's sprites when drawn
+class Dummy(pygame.sprite.Sprite):
+    def __init__(self, surf, groups):
+        super().__init__(groups)
+        self.image = surf
+        self.rect = self.image.get_frect(center=(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT)))
+
+# Stand-in meteor - gets a new rotated image every frame like Meteor.update
+class Spinner(Dummy):
+    def __init__(self, surf, groups, cached):
+        super().__init__(surf, groups)
+        self.original_surf = surf
+        self.rotation = random.uniform(0, 360)
+        self.cached = cached
+
+    def update(self):
+        self.rotation += 1.3
+        if self.cached:
+            self.image, self.mask = rotated(self.original_surf, self.rotation)
+        else:
+            self.image = pygame.transform.rotozoom(self.original_surf, self.rotation, 1)
+        self.rect = self.image.get_frect(center=self.rect.center)
+
+def time_preset(window, preset, images, meteor_surf, star_surf, sprite_count, meteor_count, frames, smooth, cached,
+                parallax):
+    random.seed(0)
+    renderer = Renderer(window, preset, smooth)
+    # Same settings as main.py
+    layers = ((pygame.transform.scale_by(star_surf, 0.3), 80, 15),) if parallax else ()
+    background = Background(renderer.size, '#3a2e3f', star_surf, 20, layers, renderer.scale)
+    sprites = pygame.sprite.Group()
+    for i in range(sprite_count):
+        Dummy(images[i % len(images)], sprites)
+    for _ in range(meteor_count):
+        Spinner(meteor_surf, sprites, cached)
+
+    # Untimed warm-up so rotated and scaled images are cached, as they are a few seconds into a game
+    for _ in range(60):
+        sprites.update()
+        renderer.draw(sprites)
+
+    update_time = draw_time = present_time = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        sprites.update()
+        background.update(1000 / 60 / 600)
+        updated = time.perf_counter()
+        background.draw(renderer.surface)
+        renderer.draw(sprites)
+        drawn = time.perf_counter()
+        renderer.present()
+        end = time.perf_counter()
+        update_time += updated - start
+        draw_time += drawn - updated
+        present_time += end - drawn
+    return renderer.size, update_time / frames * 1000, draw_time / frames * 1000, present_time / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the render presets')
+    parser.add_argument('--sprites', type=int, default=200, help='static sprites')
+    parser.add_argument('--meteors', type=int, default=30, help='sprites rotated every frame')
+    parser.add_argument('--no-rotation-cache', action='store_true', help='rotozoom every frame like the old meteors')
+    parser.add_argument('--parallax', action='store_true', help='scrolling star layer, like main.py --parallax')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--smooth', action='store_true')
+    args = parser.parse_args()
+
+    pygame.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    images = [pygame.image.load(join('images', name)).convert_alpha()
+              for name in ('meteor.png', 'laser.png', 'player.png', join('explosion', '10.png'))]
+    star_surf = pygame.image.load(join('images', 'star.png')).convert_alpha()
+
+    # Totals are the whole frame (update + draw + present), compared with native
+    native = None
+    for preset in RENDER_PRESETS:
+        size, update_ms, draw_ms, present_ms = time_preset(
+            window, preset, images, images[0], star_surf, args.sprites, args.meteors, args.frames, args.smooth,
+            not args.no_rotation_cache, args.parallax)
+        total = update_ms + draw_ms + present_ms
+        native = native or total
+        print(f'{preset:>7} {size[0]:>4}x{size[1]:<4} {size[0] * size[1]:>8} px | '
+              f'update {update_ms:6.3f} ms  draw {draw_ms:6.3f} ms  present {present_ms:6.3f} ms  '
+              f'total {total:6.3f} ms ({100 * (1 - total / native):5.1f}% saved)')
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
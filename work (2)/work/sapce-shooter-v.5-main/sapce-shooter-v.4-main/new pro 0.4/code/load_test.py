@@ -0,0 +1,84 @@
+# Load test for the headless server
+# Runs the server and stand-in clients in one process and reports how the tick loop holds up.
+# The clients share the CPU with the server, so the numbers are a lower bound for a dedicated process.
+
+import argparse
+import asyncio
+import statistics
+
+from server import Server, run_client
+
+async def run_load(sessions, spectators, duration, tick_rate):
+    server = Server(tick_rate, seed=0)
+    port = await server.start('127.0.0.1', 0)
+
+    # Players first so every spectator has a match to attach to
+    player_stats = [{} for _ in range(sessions)]
+    tasks = [asyncio.create_task(run_client('127.0.0.1', port, 'player', duration=duration, stats=stats))
+             for stats in player_stats]
+    while len(server.matches) < sessions:
+        await asyncio.sleep(0.01)
+    match_ids = list(server.matches)
+    spectator_stats = [{} for _ in range(sessions * spectators)]
+    tasks += [asyncio.create_task(run_client('127.0.0.1', port, 'spectator', match_ids[i % sessions],
+                                             duration=duration, stats=stats))
+              for i, stats in enumerate(spectator_stats)]
+
+    server.tick_times.clear()
+    server.overruns = 0
+    server.skipped = 0
+    await asyncio.gather(*tasks)
+    tick_times = sorted(server.tick_times)
+    await server.stop()
+
+    clients = player_stats + spectator_stats
+    budget = 1 / tick_rate
+    return {
+        'sessions': sessions,
+        'spectators': sessions * spectators,
+        'ticks': len(tick_times),
+        'tick_avg_ms': statistics.mean(tick_times) * 1000 if tick_times else 0,
+        'tick_p99_ms': tick_times[int(len(tick_times) * 0.99)] * 1000 if tick_times else 0,
+        'budget_ms': budget * 1000,
+        'overruns': server.overruns,
+        'skipped': server.skipped,
+        'kb_per_client_s': sum(s['bytes'] for s in clients) / len(clients) / duration / 1024,
+        'snapshots_per_client_s': sum(s['snapshots'] for s in clients) / len(clients) / duration,
+    }
+
+def report(result):
+    print(f"{result['sessions']:>5} sessions {result['spectators']:>6} spectators | "
+          f"tick avg {result['tick_avg_ms']:6.2f} ms p99 {result['tick_p99_ms']:6.2f} ms "
+          f"(budget {result['budget_ms']:.1f}) | overruns {result['overruns']:>4} skipped {result['skipped']:>5} | "
+          f"{result['kb_per_client_s']:6.1f} KB/s {result['snapshots_per_client_s']:5.1f} snaps/s per client")
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the headless Space Shooter server')
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--spectators', type=int, default=2, help='spectators per session')
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--tick-rate', type=int, default=30)
+    parser.add_argument('--ramp', action='store_true', help='double the sessions until the tick loop falls behind')
+    args = parser.parse_args()
+
+    if not args.ramp:
+        report(asyncio.run(run_load(args.sessions, args.spectators, args.duration, args.tick_rate)))
+        return
+
+    # Sustained means the p99 tick fits in the budget and no more than 1% of ticks overran
+    sessions = max(args.sessions, 1)
+    sustained = None
+    while True:
+        result = asyncio.run(run_load(sessions, args.spectators, args.duration, args.tick_rate))
+        report(result)
+        if result['tick_p99_ms'] > result['budget_ms'] or result['overruns'] > result['ticks'] * 0.01:
+            break
+        sustained = result
+        sessions *= 2
+    if sustained:
+        print(f"Sustained {sustained['sessions']} sessions with {sustained['spectators']} spectators")
+    else:
+        print('Could not sustain the starting load')
+
+if __name__ == '__main__':
+    main()
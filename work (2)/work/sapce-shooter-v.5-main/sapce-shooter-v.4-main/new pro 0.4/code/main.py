@@ -3,13 +3,25 @@
 
 import pygame
 from os.path import join
+import argparse
 import random
 import math
+from scheduler import Scheduler
+from render import RENDER_PRESETS, Background, Renderer, create_window, rotated
+
+# Display options: python code/main.py [--render native|0.75x|0.5x] [--smooth] [--vsync] [--parallax]
+parser = argparse.ArgumentParser(description='Space Shooter')
+parser.add_argument('--render', choices=RENDER_PRESETS, default='native', help='internal render resolution')
+parser.add_argument('--smooth', action='store_true', help='smooth scaling to the window instead of pixelated')
+parser.add_argument('--vsync', action='store_true', help='sync presents to the display refresh rate')
+parser.add_argument('--parallax', action='store_true', help='scrolling layer of distant stars behind the sprites')
+options = parser.parse_args()
 
 # Initialize pygame and set up the game window
 pygame.init()
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
-display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+display_surface = create_window((WINDOW_WIDTH, WINDOW_HEIGHT), options.vsync)
+renderer = Renderer(display_surface, options.render, options.smooth)
 pygame.display.set_caption('Space Shooter')
 clock = pygame.time.Clock()
 
@@ -39,13 +51,6 @@ class BaseSprite(pygame.sprite.Sprite):
         self.lifetime = 3000  # How long the sprite lives in milliseconds
         self.direction = pygame.Vector2(random.uniform(-0.5, 0.5), 1)  # Random movement direction
 
-# Star class for background decoration
-class Star(BaseSprite):
-    def __init__(self, surf, groups):
-        # Random position within the window
-        pos = (random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT))
-        super().__init__(surf, pos, groups)
-
 # Player class - the main character controlled by the user# kalid
 class Player(pygame.sprite.Sprite):
     def __init__(self, groups):
@@ -309,24 +314,29 @@ class Meteor(BaseSprite):
         if self.rect.top > WINDOW_HEIGHT:
             self.kill()
         self.rotation += self.rotation_speed * dt
-        self.image = pygame.transform.rotozoom(self.original_surf, self.rotation, 1)
+        self.image, self.mask = rotated(self.original_surf, self.rotation)
         self.rect = self.image.get_frect(center=self.rect.center)
 
 # PowerUp Class # abod
 class PowerUp(pygame.sprite.Sprite):
+    images = {}  # One surface per type, so the rotated copies are shared
+
     def __init__(self, pos, groups):
         super().__init__(groups)
         self.types = ['health', 'double_laser', 'triple_laser']
         self.type = random.choice(self.types)
         
         # Create power-up surface with different colors based on type
-        self.original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        if self.type == 'health':
-            pygame.draw.circle(self.original_image, (255, 0, 0), (15, 15), 15)  # Red for health
-        elif self.type == 'double_laser':
-            pygame.draw.circle(self.original_image, (0, 255, 0), (15, 15), 15)  # Green for double laser
-        else:  # triple_laser
-            pygame.draw.circle(self.original_image, (0, 0, 255), (15, 15), 15)  # Blue for triple laser
+        if self.type not in PowerUp.images:
+            image = pygame.Surface((30, 30), pygame.SRCALPHA)
+            if self.type == 'health':
+                pygame.draw.circle(image, (255, 0, 0), (15, 15), 15)  # Red for health
+            elif self.type == 'double_laser':
+                pygame.draw.circle(image, (0, 255, 0), (15, 15), 15)  # Green for double laser
+            else:  # triple_laser
+                pygame.draw.circle(image, (0, 0, 255), (15, 15), 15)  # Blue for triple laser
+            PowerUp.images[self.type] = image
+        self.original_image = PowerUp.images[self.type]
             
         self.image = self.original_image.copy()
         self.rect = self.image.get_frect(center=pos)
@@ -344,7 +354,7 @@ class PowerUp(pygame.sprite.Sprite):
         
         # Update rotation
         self.rotation = (self.rotation + self.rotation_speed * dt) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.rotation, 1)
+        self.image, self.mask = rotated(self.original_image, self.rotation)
         # Keep the center position after rotation
         self.rect = self.image.get_frect(center=self.rect.center)
 
@@ -482,14 +492,17 @@ power_up_sprites = pygame.sprite.Group()
 invader_sprites = pygame.sprite.Group()
 
 # Initialize game objects
-for _ in range(20):
-    Star(star_surf, all_sprites)
+# Stars are baked into the background once, so the counts can go into the thousands
+star_count = 20
+# Scrolling layers as (surface, star count, speed) tuples - off unless --parallax asks for distant stars
+parallax_layers = ((pygame.transform.scale_by(star_surf, 0.3), 80, 15),) if options.parallax else ()
+background = Background(renderer.size, '#3a2e3f', star_surf, star_count, parallax_layers, renderer.scale)
 player = Player(all_sprites)
 
 # Game variables and settings
 difficulty = 1
 difficulty_increase_interval = 8000
-last_difficulty_increase = start_time = pygame.time.get_ticks()
+start_time = pygame.time.get_ticks()
 base_meteor_speed = 200
 max_meteor_speed = 400
 base_meteor_interval = 600
@@ -497,12 +510,41 @@ min_meteor_interval = 200
 pause_time = 0
 total_pause_time = 0
 shooting_enemy_spawn_interval = 5000
-
-# Set up custom events for spawning enemies
-meteor_event = pygame.event.custom_type()
-shooting_enemy_event = pygame.event.custom_type()
-pygame.time.set_timer(meteor_event, base_meteor_interval)
-pygame.time.set_timer(shooting_enemy_event, shooting_enemy_spawn_interval)
+meteor_burst_spacing = 50  # Milliseconds between the meteors of one wave
+max_schedule_step = 100  # Longest frame the scheduler catches up on, so a hitch can't unleash a burst
+
+# Spawning and difficulty, driven by the scheduler on game time so nothing fires while paused # mo3taz
+scheduler = Scheduler()
+
+def spawn_meteor():
+    x = random.randint(0, WINDOW_WIDTH)
+    y = random.randint(-200, -100)
+    Meteor(meteor_surf, (x, y), (all_sprites, meteor_sprites))
+
+def spawn_meteor_wave():
+    # Spread the wave over several frames instead of spawning it all at once
+    num_meteors = min(1 + (difficulty // 2), 4)
+    scheduler.spread(num_meteors, meteor_burst_spacing, spawn_meteor)
+
+def spawn_shooting_enemy():
+    x = random.randint(100, WINDOW_WIDTH - 100)
+    ShootingEnemyShip((x, -50), (all_sprites, shooting_enemy_sprites), player)
+
+def spawn_power_up():
+    x = random.randint(100, WINDOW_WIDTH - 100)
+    PowerUp((x, -50), (all_sprites, power_up_sprites))
+
+def increase_difficulty():
+    global difficulty
+    difficulty += 1
+    meteor_timer.interval = max(base_meteor_interval - (difficulty - 1) * 30, min_meteor_interval)
+
+def start_spawning():
+    global meteor_timer
+    scheduler.clear()
+    meteor_timer = scheduler.every(base_meteor_interval, spawn_meteor_wave)
+    scheduler.every(shooting_enemy_spawn_interval, spawn_shooting_enemy)
+    scheduler.every(difficulty_increase_interval, increase_difficulty)
 
 # Game state variables
 running = True
@@ -515,7 +557,8 @@ start_menu = StartMenu()
 # Main game loop #all
 while running:
     # Calculate delta time for smooth movement # abod
-    dt = clock.tick() / 600
+    frame_time = clock.tick()
+    dt = frame_time / 600
     
     # Event handling
     for event in pygame.event.get():
@@ -528,7 +571,7 @@ while running:
                 if event.key == pygame.K_SPACE:
                     in_start_menu = False
                     start_time = pygame.time.get_ticks()
-                    last_difficulty_increase = start_time
+                    start_spawning()
                     game_music.play(-1)
                 elif event.key == pygame.K_q:
                     running = False
@@ -550,12 +593,12 @@ while running:
                 player.health = player.max_health
                 player.alive = True
                 start_time = pygame.time.get_ticks()
-                last_difficulty_increase = start_time
                 difficulty = 1
+                start_spawning()
                 pause_time = 0
                 total_pause_time = 0
                 for sprite in all_sprites:
-                    if not isinstance(sprite, (Player, Star)):
+                    if not isinstance(sprite, Player):
                         sprite.kill()
                 game_music.play(-1)
 
@@ -576,19 +619,6 @@ while running:
                 player.can_shoot = False
                 player.last_shot = pygame.time.get_ticks()
 
-        # Enemy spawning events # mo3taz
-        if not paused and not game_over and not in_start_menu:
-            if event.type == meteor_event:
-                num_meteors = min(1 + (difficulty // 2), 4)
-                for _ in range(num_meteors):
-                    x = random.randint(0, WINDOW_WIDTH)
-                    y = random.randint(-200, -100)
-                    Meteor(meteor_surf, (x, y), (all_sprites, meteor_sprites))
-
-            if event.type == shooting_enemy_event:
-                x = random.randint(100, WINDOW_WIDTH - 100)
-                ShootingEnemyShip((x, -50), (all_sprites, shooting_enemy_sprites), player)
-
     # Game state handling# mo3taz
     if in_start_menu:
         # Draw start menu
@@ -596,15 +626,11 @@ while running:
         start_menu.draw(display_surface)
     else:
         if not paused and not game_over:
-            # Update game difficulty
-            current_time = pygame.time.get_ticks()
-            if current_time - last_difficulty_increase >= difficulty_increase_interval:
-                difficulty += 1
-                last_difficulty_increase = current_time
-                new_interval = max(base_meteor_interval - (difficulty - 1) * 30, min_meteor_interval)
-                pygame.time.set_timer(meteor_event, int(new_interval))
+            # Run spawns and difficulty increases that came due this frame
+            scheduler.advance(min(frame_time, max_schedule_step))
 
             # Update all game objects
+            background.update(dt)
             all_sprites.update(dt)
 
             # Handle player collisions and damage # mohamed
@@ -642,8 +668,7 @@ while running:
                         player.kill_count += 1
                         if player.kill_count >= player.kills_for_power_up:
                             player.kill_count = 0
-                            x = random.randint(100, WINDOW_WIDTH - 100)
-                            PowerUp((x, -50), (all_sprites, power_up_sprites))
+                            scheduler.schedule(0, spawn_power_up)
 
                 enemy_hits = pygame.sprite.spritecollide(laser, shooting_enemy_sprites, False)
                 if enemy_hits:
@@ -656,8 +681,7 @@ while running:
                             player.kill_count += 1
                             if player.kill_count >= player.kills_for_power_up:
                                 player.kill_count = 0
-                                x = random.randint(100, WINDOW_WIDTH - 100)
-                                PowerUp((x, -50), (all_sprites, power_up_sprites))
+                                scheduler.schedule(0, spawn_power_up)
 
             # Handle power-up collisions
             power_up_hits = pygame.sprite.spritecollide(player, power_up_sprites, True, pygame.sprite.collide_mask)
@@ -665,9 +689,11 @@ while running:
                 player.apply_power_up(power_up.type)
                 AnimatedExplosion(explosion_frames, power_up.rect.center, all_sprites)
 
-        # Draw game state
-        display_surface.fill('#3a2e3f')
-        all_sprites.draw(display_surface)
+        # Draw the world at the internal resolution and scale it up to the window,
+        # then draw the HUD and overlays at native resolution so text stays sharp
+        background.draw(renderer.surface)
+        renderer.draw(all_sprites)
+        renderer.present()
 
         if not game_over:
             draw_ui()
@@ -0,0 +1,129 @@
+# Render Pipeline
+# Draws the game world at an internal resolution and scales it up to the window in one pass,
+# so fill and blit cost follow the internal pixel count. The HUD is drawn on the window
+# afterwards and stays sharp. Shared by the game (main.py) and the benchmark (benchmark.py).
+
+import random
+import weakref
+import pygame
+
+# Internal resolution presets as a fraction of the window size
+RENDER_PRESETS = {'native': 1, '0.75x': 0.75, '0.5x': 0.5}
+
+# Rotated copies of sprite images with their collision masks, shared by every sprite using the
+# same source image. Rotating sprites reuse these instead of making a new surface each frame,
+# so the renderer's scaled copies stay cached too.
+ROTATION_STEP = 2  # Degrees between cached angles
+rotations = {}
+
+def rotated(surf, angle):
+    step = int(angle // ROTATION_STEP) % (360 // ROTATION_STEP)
+    entry = rotations.get((surf, step))
+    if entry is None:
+        image = pygame.transform.rotozoom(surf, step * ROTATION_STEP, 1)
+        entry = rotations[(surf, step)] = (image, pygame.mask.from_surface(image))
+    return entry
+
+# Scatter stars over a surface once, wrapping the ones that cross the top/bottom edge
+def scatter_stars(surface, surf, count):
+    width, height = surface.get_size()
+    half_w, half_h = surf.get_width() / 2, surf.get_height() / 2
+    blits = []
+    for _ in range(count):
+        x = random.randint(0, width) - half_w
+        y = random.randint(0, height) - half_h
+        blits.append((surf, (x, y)))
+        # Copy edge stars to the other side so scrolling layers tile seamlessly
+        if y < 0:
+            blits.append((surf, (x, y + height)))
+        elif y + 2 * half_h > height:
+            blits.append((surf, (x, y - height)))
+    surface.blits(blits, False)
+
+# Scrolling star layer - a pre-baked surface drawn with one or two blits
+class ParallaxLayer:
+    def __init__(self, surf, count, speed, size, color):
+        # Opaque and colorkeyed on the clear color rather than per-pixel alpha: star edges blend into the
+        # clear color when baked, and the RLE-encoded blit skips the empty pixels instead of blending them.
+        # The trade-off is that those baked edges draw as a dark fringe where a layer star passes over a
+        # static star - the per-pixel alpha version has no fringe but costs about 2.5x more per frame.
+        self.surf = pygame.Surface(size).convert()
+        self.surf.fill(color)
+        scatter_stars(self.surf, surf, count)
+        self.surf.set_colorkey(color, pygame.RLEACCEL)
+        self.speed = speed  # Same units as the sprite speeds (pixels per dt), positive scrolls downwards
+        self.offset = 0
+
+    def update(self, dt):
+        self.offset = (self.offset + self.speed * dt) % self.surf.get_height()
+
+    def draw(self, surface):
+        offset = int(self.offset)
+        surface.blit(self.surf, (0, offset))
+        if offset:
+            surface.blit(self.surf, (0, offset - self.surf.get_height()))
+
+# Background class - clear color and static stars composited once into a cached surface
+class Background:
+    def __init__(self, size, color, star_surf, star_count, layers=(), scale=1):
+        # Baked at the internal render resolution, in the display format so the per-frame blit is a plain copy
+        self.surf = pygame.Surface(size).convert()
+        self.surf.fill(color)
+        scatter_stars(self.surf, pygame.transform.scale_by(star_surf, scale), star_count)
+        self.layers = [ParallaxLayer(pygame.transform.scale_by(surf, scale), count, speed * scale, size, color)
+                       for surf, count, speed in layers]
+
+    def update(self, dt):
+        for layer in self.layers:
+            layer.update(dt)
+
+    def draw(self, surface):
+        # Replaces the full-screen fill, so the cost doesn't depend on the star count
+        surface.blit(self.surf, (0, 0))
+        for layer in self.layers:
+            layer.draw(surface)
+
+# Open the game window; vsync needs a renderer-backed display, which SCALED provides
+def create_window(size, vsync=False):
+    if vsync:
+        return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+    return pygame.display.set_mode(size)
+
+# Renderer class - owns the internal surface and the scaled sprite images
+class Renderer:
+    def __init__(self, window, preset='native', smooth=False):
+        self.window = window
+        self.scale = RENDER_PRESETS[preset]
+        self.smooth = smooth
+        width, height = window.get_size()
+        self.size = (round(width * self.scale), round(height * self.scale))
+        # At native resolution the world is drawn straight onto the window
+        self.surface = window if self.scale == 1 else pygame.Surface(self.size).convert()
+        # Scaled copies of sprite images, dropped once the original surface is gone
+        self.images = weakref.WeakKeyDictionary()
+
+    def image(self, surf):
+        if self.scale == 1:
+            return surf
+        scaled = self.images.get(surf)
+        if scaled is None:
+            width = max(1, round(surf.get_width() * self.scale))
+            height = max(1, round(surf.get_height() * self.scale))
+            scaled = pygame.transform.scale(surf, (width, height))
+            self.images[surf] = scaled
+        return scaled
+
+    def draw(self, sprites):
+        # Sprites keep their window-space rects; only the drawing is scaled
+        scale = self.scale
+        self.surface.blits([(self.image(sprite.image), (sprite.rect.x * scale, sprite.rect.y * scale))
+                            for sprite in sprites], False)
+
+    def present(self):
+        # Single scale pass from the internal surface onto the window
+        if self.surface is self.window:
+            return
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, self.window.get_size(), self.window)
+        else:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
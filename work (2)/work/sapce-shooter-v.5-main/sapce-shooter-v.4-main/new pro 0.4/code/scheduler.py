@@ -0,0 +1,64 @@
+# Spawn Scheduler
+# Runs callbacks on simulation time instead of pygame timer events, so nothing fires while the
+# game isn't advancing and the same sequence of advance() calls always gives the same result.
+# Shared by the game (main.py) and the headless server (server.py).
+
+import heapq
+import itertools
+
+# Timer class - handle returned by the scheduler so callers can retune or cancel it
+class Timer:
+    def __init__(self, due, interval, callback, args):
+        self.due = due
+        self.interval = interval  # None for one-shot timers
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+# Scheduler class - priority queue of timers ordered by due time
+class Scheduler:
+    def __init__(self):
+        self.time = 0
+        self.queue = []
+        self.order = itertools.count()  # Tie-breaker keeps timers due together in scheduling order
+
+    def push(self, timer):
+        heapq.heappush(self.queue, (timer.due, next(self.order), timer))
+        return timer
+
+    def schedule(self, delay, callback, *args):
+        # Run callback once, delay milliseconds from now
+        return self.push(Timer(self.time + delay, None, callback, args))
+
+    def every(self, interval, callback, *args, delay=None):
+        # Run callback every interval milliseconds; changing timer.interval applies from the next run
+        if interval <= 0:
+            raise ValueError('interval must be positive')
+        first = interval if delay is None else delay
+        return self.push(Timer(self.time + first, interval, callback, args))
+
+    def spread(self, count, spacing, callback, *args):
+        # Run callback count times, spacing milliseconds apart, instead of all in one frame
+        return [self.schedule(i * spacing, callback, *args) for i in range(count)]
+
+    def advance(self, ms):
+        # Move simulation time forward and run everything that came due, in order.
+        # Callbacks see self.time as their exact due time, whatever the frame length.
+        target = self.time + ms
+        while self.queue and self.queue[0][0] <= target:
+            due, _, timer = heapq.heappop(self.queue)
+            if timer.cancelled:
+                continue
+            self.time = due
+            timer.callback(*timer.args)
+            if timer.interval is not None and not timer.cancelled:
+                timer.due = due + timer.interval
+                self.push(timer)
+        self.time = target
+
+    def clear(self):
+        self.queue.clear()
+        self.time = 0
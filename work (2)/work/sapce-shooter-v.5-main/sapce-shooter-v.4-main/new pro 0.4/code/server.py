@@ -0,0 +1,608 @@
+# Space Shooter Server
+# Runs matches headless at a fixed tick rate and streams them to thin clients and spectators
+#
+# Protocol: newline-delimited JSON over TCP
+#   client -> server  {"t": "join", "role": "player"}                      start a new match
+#                     {"t": "join", "role": "spectator", "match": id}      watch a match (any match if no id)
+#                     {"t": "input", "keys": [left, right, up, down], "fire": 1}
+#                     {"t": "view", "rect": [x, y, w, h]}                  area of interest
+#   server -> client  {"t": "welcome", "match": id, "tick": n, "rate": hz, "kinds": [...], "power_ups": [...]}
+#                     {"t": "snap", "tick": n, "add": [[id, kind, x, y, a(, type)]], "upd": [[id, dx, dy(, a)]],
+#                      "del": [id], "hud": {...}}
+#                     {"t": "over", "score": n} / {"t": "end"}
+#   kind and type index the welcome's "kinds" and "power_ups" lists; only power-ups carry a type.
+#   a is the image angle for pygame.transform.rotate (degrees counter-clockwise) quantized to a byte.
+
+import argparse
+import asyncio
+import collections
+import json
+import math
+import random
+
+from scheduler import Scheduler
+
+# Playfield and game settings - these mirror main.py, which can't be imported without a display
+WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
+base_meteor_speed = 200
+max_meteor_speed = 400
+base_meteor_interval = 600
+min_meteor_interval = 200
+difficulty_increase_interval = 8000
+shooting_enemy_spawn_interval = 5000
+meteor_burst_spacing = 50
+
+# Server settings
+TICK_RATE = 30
+SEND_BUFFER_LIMIT = 64 * 1024  # Skip snapshots for a client while this much is still unsent
+STALL_SECONDS = 5  # Drop clients that haven't drained for this long
+TICK_HISTORY = 10000  # Recent tick durations kept for load reports (about 5 minutes at 30 Hz)
+VIEW_MARGIN = 100  # Keep entities just outside the view so they don't pop in
+
+# Entity kinds, sent once in the welcome message so snapshots only carry the index
+KINDS = ['player', 'meteor', 'laser', 'enemy', 'enemy_laser', 'power_up']
+PLAYER, METEOR, LASER, ENEMY, ENEMY_LASER, POWER_UP = range(len(KINDS))
+SIZES = {
+    PLAYER: (112, 75),
+    METEOR: (101, 84),
+    LASER: (9, 54),
+    ENEMY: (90, 90),
+    ENEMY_LASER: (12, 40),
+    POWER_UP: (30, 30),
+}
+POWER_UP_TYPES = ['health', 'double_laser', 'triple_laser']
+
+# Entity class - plain position/velocity record standing in for the pygame sprites
+class Entity:
+    def __init__(self, entity_id, kind, x, y, vx=0, vy=0, angle=0):
+        self.id = entity_id
+        self.kind = kind
+        self.x, self.y = x, y
+        self.vx, self.vy = vx, vy
+        self.angle = angle
+        self.w, self.h = SIZES[kind]
+        self.alive = True
+        self.state = {}  # Per-kind extras (enemy movement, meteor spin, power-up type)
+
+    def collides(self, other):
+        return (abs(self.x - other.x) * 2 < self.w + other.w and
+                abs(self.y - other.y) * 2 < self.h + other.h)
+
+    def quantized(self):
+        # Whole pixels and a one-byte angle are all a client needs to draw the entity
+        return (self.kind, round(self.x), round(self.y), int(self.angle % 360 * 256 / 360))
+
+# Headless simulation of one match - the main loop's spawns, movement and scoring, driven by simulation time.
+# Deliberate differences from main.py:
+# - Collisions use bounding boxes instead of the pixel masks main.py gets from the sprite images,
+#   and a player laser destroys only the first meteor or enemy it touches.
+# - The match ends when health reaches 0. main.py ends the game on the first enemy laser hit and
+#   never ends it on meteor or enemy hits, however low health goes.
+# - A hit gives 500 ms of invincibility. main.py compares invincible_duration = 0.5 against
+#   millisecond ticks, so its invincibility ends on the next frame.
+# - Enemy lasers fly towards the aim point. main.py moves them along from_polar of the image angle,
+#   which is a quarter turn away from it. The angle sent to clients is the same image angle.
+class Simulation:
+    def __init__(self, tick_rate=TICK_RATE, seed=None):
+        self.tick_rate = tick_rate  # Steps per second of simulation time, so game speed doesn't depend on it
+        self.random = random.Random(seed)
+        self.scheduler = Scheduler()
+        self.reset()
+
+    def reset(self):
+        self.entities = {}
+        self.next_id = 0
+        self.tick = 0
+        self.steps = 0  # Steps actually played, which set the simulation time
+        self.difficulty = 1
+        self.game_over = False
+        self.keys = (False, False, False, False)
+        self.fire = False
+
+        self.player = self.spawn(PLAYER, WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2)
+        self.player_velocity = (0, 0)  # Tracked for the enemies' lead aim
+        self.health = 3
+        self.max_health = 5
+        self.invincible_until = 0
+        self.last_shot = -1000
+        self.laser_mode = 'single'
+        self.power_up_until = 0
+        self.kill_count = 0
+
+        # Same timers as the main loop
+        self.scheduler.clear()
+        self.meteor_timer = self.scheduler.every(base_meteor_interval, self.spawn_meteor_wave)
+        self.scheduler.every(shooting_enemy_spawn_interval, self.spawn_shooting_enemy)
+        self.scheduler.every(difficulty_increase_interval, self.increase_difficulty)
+
+    def spawn(self, kind, x, y, vx=0, vy=0, angle=0):
+        entity = Entity(self.next_id, kind, x, y, vx, vy, angle)
+        self.entities[entity.id] = entity
+        self.next_id += 1
+        return entity
+
+    def spawn_meteor(self):
+        speed_multiplier = min(1 + (self.difficulty - 1) * 0.3, 2.5)
+        speed = self.random.randint(int(base_meteor_speed * speed_multiplier),
+                                    int(max_meteor_speed * speed_multiplier))
+        x = self.random.randint(0, WINDOW_WIDTH)
+        y = self.random.randint(-200, -100)
+        meteor = self.spawn(METEOR, x, y, self.random.uniform(-0.5, 0.5) * speed, speed)
+        meteor.state['spin'] = self.random.randint(30, 50)
+
+    def spawn_meteor_wave(self):
+        num_meteors = min(1 + (self.difficulty // 2), 4)
+        self.scheduler.spread(num_meteors, meteor_burst_spacing, self.spawn_meteor)
+
+    def spawn_shooting_enemy(self):
+        enemy = self.spawn(ENEMY, self.random.randint(100, WINDOW_WIDTH - 100), -50)
+        enemy.state.update(health=3, moving_right=True, vertical=False, distance=0, phase=0,
+                           last_shot=self.time, charging=False, last_charge=self.time, charge_start=0,
+                           charge_direction=(0, 0))
+
+    def spawn_power_up(self):
+        power_up = self.spawn(POWER_UP, self.random.randint(100, WINDOW_WIDTH - 100), -50, 0, 200)
+        power_up.state['type'] = self.random.choice(POWER_UP_TYPES)
+        power_up.state['spin'] = 100
+
+    def increase_difficulty(self):
+        self.difficulty += 1
+        self.meteor_timer.interval = max(base_meteor_interval - (self.difficulty - 1) * 30, min_meteor_interval)
+
+    @property
+    def time(self):
+        return self.scheduler.time
+
+    @property
+    def score(self):
+        return int(self.time // 100)
+
+    def set_input(self, keys, fire):
+        self.keys = tuple(bool(k) for k in (list(keys) + [False] * 4)[:4])
+        self.fire = self.fire or bool(fire)
+
+    def step(self):
+        # Same speed units as the main loop, which divides the frame time by 600
+        dt = 1000 / self.tick_rate / 600
+        self.tick += 1
+        if self.game_over:
+            return
+
+        # Spawns and difficulty increases that came due this tick. Time is derived from the step
+        # count rather than summed, so a fractional tick length doesn't drift off the timers.
+        self.steps += 1
+        self.scheduler.advance(self.steps * 1000 / self.tick_rate - self.scheduler.time)
+
+        self.update_player(dt)
+        for entity in list(self.entities.values()):
+            if entity.kind == ENEMY:
+                self.update_enemy(entity, dt)
+            elif entity.kind != PLAYER:
+                entity.x += entity.vx * dt
+                entity.y += entity.vy * dt
+                if entity.kind in (METEOR, POWER_UP):
+                    entity.angle += entity.state['spin'] * dt
+            # Lasers die on any edge like main.py's; everything else spawns above the screen and can
+            # wander past the sides, so it's only removed once it drops below the bottom
+            if entity.kind in (LASER, ENEMY_LASER):
+                if (entity.y + entity.h / 2 < 0 or entity.y - entity.h / 2 > WINDOW_HEIGHT or
+                        entity.x + entity.w / 2 < 0 or entity.x - entity.w / 2 > WINDOW_WIDTH):
+                    entity.alive = False
+            elif entity.y - entity.h / 2 > WINDOW_HEIGHT:
+                entity.alive = False
+
+        self.handle_collisions()
+        self.entities = {i: e for i, e in self.entities.items() if e.alive}
+
+    def update_player(self, dt):
+        left, right, up, down = self.keys
+        dx, dy = int(right) - int(left), int(down) - int(up)
+        length = math.hypot(dx, dy)
+        old_x, old_y = self.player.x, self.player.y
+        if length:
+            self.player.x = max(0, min(self.player.x + dx / length * 300 * dt, WINDOW_WIDTH))
+            self.player.y = max(0, min(self.player.y + dy / length * 300 * dt, WINDOW_HEIGHT))
+        self.player_velocity = ((self.player.x - old_x) / dt, (self.player.y - old_y) / dt)
+
+        if self.laser_mode != 'single' and self.time > self.power_up_until:
+            self.laser_mode = 'single'
+
+        if self.fire and self.time - self.last_shot > 200:
+            offsets = {'single': (0,), 'double': (-15, 15), 'triple': (0, -20, 20)}[self.laser_mode]
+            for offset in offsets:
+                self.spawn(LASER, self.player.x + offset, self.player.y - self.player.h / 2, 0, -400)
+            self.last_shot = self.time
+        self.fire = False
+
+    def update_enemy(self, enemy, dt):
+        state = enemy.state
+        state['phase'] += dt
+
+        # Charge at the player every few seconds
+        if not state['charging'] and self.time - state['last_charge'] > 2500:
+            distance = math.hypot(self.player.x - enemy.x, self.player.y - enemy.y)
+            if distance:
+                state['charge_direction'] = ((self.player.x - enemy.x) / distance,
+                                             (self.player.y - enemy.y) / distance)
+            state['charging'] = True
+            state['charge_start'] = self.time
+        if state['charging']:
+            if self.time - state['charge_start'] < 800:
+                enemy.x += state['charge_direction'][0] * 500 * dt
+                enemy.y += state['charge_direction'][1] * 500 * dt
+            else:
+                state['charging'] = False
+                state['last_charge'] = self.time
+
+        # Zigzag sideways, then step down
+        if not state['charging']:
+            if state['vertical']:
+                enemy.y += 70 * dt
+                state['distance'] += 70 * dt
+                if state['distance'] >= 40:
+                    state['vertical'], state['distance'] = False, 0
+            else:
+                enemy.x += 250 * dt if state['moving_right'] else -250 * dt
+                enemy.y += math.sin(state['phase'] * 2.5) * 120 * dt
+                state['distance'] += 250 * dt
+                if state['distance'] >= 250:
+                    state['vertical'], state['distance'] = True, 0
+                    state['moving_right'] = not state['moving_right']
+
+        # Shoot where the player will be when the laser gets there
+        if (self.time - state['last_shot'] > 1200 and not state['charging'] and
+                enemy.y < self.player.y):
+            state['last_shot'] = self.time
+            time_to_reach = math.hypot(self.player.x - enemy.x, self.player.y - enemy.y) / 800
+            target_x = self.player.x + self.player_velocity[0] * time_to_reach
+            target_y = self.player.y + self.player_velocity[1] * time_to_reach
+            dx, dy = target_x - enemy.x, target_y - enemy.y
+            spread = self.random.uniform(-3, 3)
+            # Image angle as EnemyLaser.__init__ computes it; the spread is counter-clockwise like the angle
+            angle = math.degrees(math.atan2(-dy, dx)) - 90 + spread
+            heading = math.atan2(dy, dx) - math.radians(spread)
+            self.spawn(ENEMY_LASER, enemy.x, enemy.y, math.cos(heading) * 1000, math.sin(heading) * 1000, angle)
+
+    def handle_collisions(self):
+        by_kind = {kind: [] for kind in range(len(KINDS))}
+        for entity in self.entities.values():
+            if entity.alive:
+                by_kind[entity.kind].append(entity)
+
+        # Lasers against meteors and enemies
+        for laser in by_kind[LASER]:
+            for target in by_kind[METEOR] + by_kind[ENEMY]:
+                if target.alive and laser.collides(target):
+                    laser.alive = False
+                    if target.kind == ENEMY:
+                        target.state['health'] -= 1
+                        if target.state['health'] > 0:
+                            break
+                    target.alive = False
+                    self.kill_count += 1
+                    if self.kill_count >= 3:
+                        self.kill_count = 0
+                        self.scheduler.schedule(0, self.spawn_power_up)
+                    break
+
+        # Player damage
+        if self.time > self.invincible_until:
+            for kind, damage in ((METEOR, 1), (ENEMY_LASER, 1), (ENEMY, 2)):
+                for entity in by_kind[kind]:
+                    if entity.alive and entity.collides(self.player):
+                        entity.alive = False
+                        self.health -= damage
+                        self.invincible_until = self.time + 500
+            if self.health <= 0:
+                self.game_over = True
+
+        for power_up in by_kind[POWER_UP]:
+            if power_up.collides(self.player):
+                power_up.alive = False
+                self.power_up_until = self.time + 20000
+                if power_up.state['type'] == 'health':
+                    self.health = min(self.health + 1, self.max_health)
+                else:
+                    self.laser_mode = power_up.state['type'].split('_')[0]
+
+    def hud(self):
+        return {'hp': self.health, 'score': self.score, 'level': self.difficulty, 'power': self.laser_mode}
+
+# Connected client - tracks what it has been sent so each snapshot only carries the changes
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.role = None
+        self.match = None
+        self.view = (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.baseline = {}  # Entity id -> last quantized state sent to this client
+        self.last_hud = None
+        self.stalled = 0
+        self.skipped = 0
+        self.bytes_sent = 0
+
+    def send(self, message):
+        data = json.dumps(message, separators=(',', ':')).encode() + b'\n'
+        self.writer.write(data)
+        self.bytes_sent += len(data)
+
+    def in_view(self, entity):
+        x, y, w, h = self.view
+        return (x - VIEW_MARGIN <= entity.x <= x + w + VIEW_MARGIN and
+                y - VIEW_MARGIN <= entity.y <= y + h + VIEW_MARGIN)
+
+    def snapshot(self, simulation):
+        # Delta against the last snapshot this client actually received - TCP keeps them in order
+        add, upd = [], []
+        current = {}
+        for entity in simulation.entities.values():
+            if not self.in_view(entity):
+                continue
+            state = entity.quantized()
+            current[entity.id] = state
+            old = self.baseline.get(entity.id)
+            if old is None:
+                if entity.kind == POWER_UP:
+                    add.append([entity.id, *state, POWER_UP_TYPES.index(entity.state['type'])])
+                else:
+                    add.append([entity.id, *state])
+            elif old != state:
+                update = [entity.id, state[1] - old[1], state[2] - old[2]]
+                if state[3] != old[3]:
+                    update.append(state[3])
+                upd.append(update)
+        removed = [entity_id for entity_id in self.baseline if entity_id not in current]
+        self.baseline = current
+
+        message = {'t': 'snap', 'tick': simulation.tick}
+        if add:
+            message['add'] = add
+        if upd:
+            message['upd'] = upd
+        if removed:
+            message['del'] = removed
+        hud = simulation.hud()
+        if hud != self.last_hud:
+            message['hud'] = hud
+            self.last_hud = hud
+        return message
+
+# Match class - one simulation with its player and spectators
+class Match:
+    def __init__(self, match_id, tick_rate=TICK_RATE, seed=None):
+        self.id = match_id
+        self.simulation = Simulation(tick_rate, seed)
+        self.stall_limit = tick_rate * STALL_SECONDS
+        self.player = None
+        self.spectators = set()
+
+    def clients(self):
+        return ([self.player] if self.player else []) + list(self.spectators)
+
+    def step(self):
+        self.simulation.step()
+        if self.simulation.game_over:
+            for client in self.clients():
+                client.send({'t': 'over', 'score': self.simulation.score})
+                client.baseline = {}
+            self.simulation.reset()
+
+    def broadcast(self):
+        # Returns how many snapshots were skipped for backpressure
+        skipped = 0
+        for client in self.clients():
+            transport = client.writer.transport
+            if transport.is_closing():
+                continue
+            # Backpressure: skip slow clients instead of queueing. Their baseline stays put,
+            # so the next snapshot they do get still carries everything they missed.
+            if transport.get_write_buffer_size() > SEND_BUFFER_LIMIT:
+                client.skipped += 1
+                client.stalled += 1
+                skipped += 1
+                if client.stalled > self.stall_limit:
+                    transport.abort()
+                continue
+            client.stalled = 0
+            client.send(client.snapshot(self.simulation))
+        return skipped
+
+# Server class - accepts connections and runs every match on one fixed-rate tick loop
+class Server:
+    def __init__(self, tick_rate=TICK_RATE, seed=None):
+        self.tick_interval = 1 / tick_rate
+        self.tick_rate = tick_rate
+        self.seed = seed
+        self.matches = {}
+        self.next_match = 0
+        self.tick_times = collections.deque(maxlen=TICK_HISTORY)
+        self.overruns = 0
+        self.skipped = 0  # Snapshots withheld from slow clients, across every match
+        self.running = False
+
+    async def start(self, host='127.0.0.1', port=8765):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        self.running = True
+        self.loop_task = asyncio.create_task(self.run())
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.running = False
+        self.server.close()
+        for match in list(self.matches.values()):
+            for client in match.clients():
+                client.writer.transport.abort()
+        await self.server.wait_closed()
+        await self.loop_task
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self.running:
+            start = loop.time()
+            for match in list(self.matches.values()):
+                match.step()
+                self.skipped += match.broadcast()
+            self.tick_times.append(loop.time() - start)
+
+            # Fixed rate: sleep until the next deadline, and don't try to catch up after an overrun
+            next_tick += self.tick_interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                self.overruns += 1
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    async def handle_client(self, reader, writer):
+        client = Client(reader, writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                self.handle_message(client, message)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.leave(client)
+            writer.close()
+
+    def handle_message(self, client, message):
+        kind = message.get('t')
+        if kind == 'join' and client.match is None:
+            if message.get('role') == 'player':
+                match = Match(self.next_match, self.tick_rate,
+                              None if self.seed is None else self.seed + self.next_match)
+                self.matches[match.id] = match
+                self.next_match += 1
+                match.player = client
+                client.role = 'player'
+            else:
+                # An explicit id must exist; without one, watch any match
+                match_id = message.get('match')
+                if match_id is None:
+                    match = next(iter(self.matches.values()), None)
+                else:
+                    match = self.matches.get(match_id) if isinstance(match_id, int) else None
+                if match is None:
+                    client.send({'t': 'end'})
+                    return
+                match.spectators.add(client)
+                client.role = 'spectator'
+            client.match = match
+            client.send({'t': 'welcome', 'match': match.id, 'tick': match.simulation.tick,
+                         'rate': self.tick_rate, 'kinds': KINDS, 'power_ups': POWER_UP_TYPES})
+        elif kind == 'input' and client.role == 'player':
+            # Malformed messages are ignored like bad JSON, so they can't end the match
+            keys = message.get('keys', [])
+            if isinstance(keys, list):
+                client.match.simulation.set_input(keys, message.get('fire'))
+        elif kind == 'view':
+            rect = message.get('rect')
+            if (isinstance(rect, list) and len(rect) == 4 and
+                    all(isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v) for v in rect)):
+                client.view = tuple(float(v) for v in rect)
+
+    def leave(self, client):
+        match = client.match
+        if match is None:
+            return
+        if client is match.player:
+            # The match ends with its player
+            for spectator in match.spectators:
+                spectator.send({'t': 'end'})
+                spectator.writer.close()
+            del self.matches[match.id]
+        else:
+            match.spectators.discard(client)
+        client.match = None
+
+# Stand-in client - mirrors the world from snapshots and, as a player, mashes random inputs
+async def run_client(host, port, role='player', match=None, duration=None, stats=None):
+    stats = stats if stats is not None else {}
+    stats.setdefault('snapshots', 0)
+    stats.setdefault('bytes', 0)
+    reader, writer = await asyncio.open_connection(host, port)
+    join = {'t': 'join', 'role': role}
+    if match is not None:
+        join['match'] = match
+    writer.write(json.dumps(join).encode() + b'\n')
+
+    world = {}
+    hud = {}
+    rng = random.Random()
+    loop = asyncio.get_running_loop()
+    end = None if duration is None else loop.time() + duration
+    try:
+        while end is None or loop.time() < end:
+            timeout = None if end is None else max(end - loop.time(), 0)
+            try:
+                line = await asyncio.wait_for(reader.readline(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if not line:
+                break
+            stats['bytes'] += len(line)
+            message = json.loads(line)
+            if message['t'] == 'snap':
+                stats['snapshots'] += 1
+                for entity_id, kind, x, y, angle, *extra in message.get('add', ()):
+                    world[entity_id] = [kind, x, y, angle, *extra]
+                for update in message.get('upd', ()):
+                    entity = world[update[0]]
+                    entity[1] += update[1]
+                    entity[2] += update[2]
+                    if len(update) > 3:
+                        entity[3] = update[3]
+                for entity_id in message.get('del', ()):
+                    world.pop(entity_id, None)
+                hud.update(message.get('hud', {}))
+                if role == 'player' and rng.random() < 0.2:
+                    keys = [rng.random() < 0.5 for _ in range(4)]
+                    writer.write(json.dumps({'t': 'input', 'keys': keys, 'fire': rng.random() < 0.5}).encode() + b'\n')
+            elif message['t'] in ('over', 'welcome'):
+                world.clear()
+            elif message['t'] == 'end':
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+    stats['entities'] = len(world)
+    stats['hud'] = hud
+    return stats
+
+async def serve(host, port, tick_rate, seed):
+    server = Server(tick_rate, seed)
+    port = await server.start(host, port)
+    print(f'Serving on {host}:{port} at {tick_rate} ticks per second')
+    await server.loop_task
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless Space Shooter server')
+    parser.add_argument('mode', choices=['serve', 'client', 'spectate'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--tick-rate', type=int, default=TICK_RATE)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--match', type=int)
+    parser.add_argument('--duration', type=float)
+    args = parser.parse_args()
+
+    if args.mode == 'serve':
+        asyncio.run(serve(args.host, args.port, args.tick_rate, args.seed))
+    else:
+        role = 'player' if args.mode == 'client' else 'spectator'
+        stats = asyncio.run(run_client(args.host, args.port, role, args.match, args.duration))
+        print(stats)
+
+if __name__ == '__main__':
+    main()